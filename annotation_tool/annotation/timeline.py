@@ -1,5 +1,4 @@
 from collections import namedtuple
-import time
 from typing import Tuple
 
 import PyQt6.QtCore as qtc
@@ -431,10 +430,7 @@ class QTimeLine(qtw.QWidget):
         self._draw_mouse_pos(qp)
 
         # This is the bottleneck for drawing the timeline
-        _s_draw = time.perf_counter()  # noqa
         self._draw_samples(qp)
-        _e_draw = time.perf_counter()  # noqa
-        # print(f"Drawing samples took {_e_draw - _s_draw: .4f} seconds")
 
         # Clear clip path
         path = qtg.QPainterPath()
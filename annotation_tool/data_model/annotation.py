@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+import functools
 import logging
 from pathlib import Path
 import time
@@ -9,13 +10,22 @@ import numpy as np
 from annotation_tool.file_cache import cached
 from annotation_tool.media_reader import meta_data as get_meta_data
 from annotation_tool.utility.decorators import accepts, returns
-from annotation_tool.utility.filehandler import checksum, is_non_zero_file
+from annotation_tool.utility.filehandler import (
+    checksum,
+    is_non_zero_file,
+    non_zero_file_stat,
+)
 
 from .dataset import Dataset
 from .sample import Sample
 from .single_annotation import empty_annotation
 
 
+@functools.lru_cache(maxsize=1024)
+def __format_timestamp__(creation_time: float) -> str:
+    return time.strftime("%Y-%m-%d_%H-%M-%S", time.localtime(creation_time))
+
+
 @cached
 @dataclass
 class Annotation:
@@ -51,38 +61,41 @@ class Annotation:
     def samples(self, list_of_samples: List[Sample]):
         if len(list_of_samples) == 0:
             raise ValueError("List must have at least 1 element.")
-        else:
-            last = -1
-            for sample in list_of_samples:
-                if sample is None:
-                    raise ValueError("Elements must not be None.")
-                if not isinstance(sample, Sample):
-                    raise ValueError("Elements must be from type Sample.")
-                if sample.start_position != last + 1:
-                    logging.error("Last = {} | sample = {}".format(last, sample))
-                    raise ValueError("Gaps between Samples are not allowed!")
-                last = sample.end_position
-
-            self._samples = list_of_samples
-            self._last_save = time.time()
+        if any(sample is None for sample in list_of_samples):
+            raise ValueError("Elements must not be None.")
+        if not all(isinstance(sample, Sample) for sample in list_of_samples):
+            raise ValueError("Elements must be from type Sample.")
+
+        n = len(list_of_samples)
+        starts = np.fromiter((s.start_position for s in list_of_samples), np.int64, n)
+        ends = np.fromiter((s.end_position for s in list_of_samples), np.int64, n)
+
+        # each sample has to start right after its predecessor
+        expected_starts = np.concatenate(([0], ends[:-1] + 1))
+        gaps = np.flatnonzero(starts != expected_starts)
+        if gaps.size > 0:
+            idx = gaps[0]
+            last = expected_starts[idx] - 1
+            logging.error("Last = {} | sample = {}".format(last, list_of_samples[idx]))
+            raise ValueError("Gaps between Samples are not allowed!")
+
+        self._samples = list_of_samples
+        self._last_save = time.time()
 
     def to_numpy(self) -> np.ndarray:
         """
         Converts the samples to a numpy array.
 
         Returns:
-            np.ndarray: The samples as a numpy array.
+            np.ndarray: The samples as a numpy array with dtype uint8,
+                one row per frame.
         """
-        x = []
-        for sample in self.samples:
-            lower = sample.start_position
-            upper = sample.end_position
-            annotation_vector = sample.annotation.annotation_vector
-
-            for _ in range(upper - lower + 1):
-                x.append(annotation_vector)
-        x = np.array(x, int)
-        return x
+        # the samples are edited in-place by the controllers,
+        # so the arrays are built from the current samples on every call
+        samples = self.samples
+        lengths = np.fromiter((len(s) for s in samples), np.int64, len(samples))
+        matrix = np.stack([s.annotation.annotation_vector for s in samples])
+        return np.repeat(matrix.astype(np.uint8), lengths, axis=0)
 
     @property
     def dataset(self) -> Dataset:
@@ -94,9 +107,10 @@ class Annotation:
 
     @path.setter
     def path(self, path: Path):
-        if not path.is_file():
+        st = non_zero_file_stat(path)
+        if st is None:
             raise FileNotFoundError(path)
-        if checksum(path) != self.checksum:
+        if checksum(path, st) != self.checksum:
             raise ValueError("File has changed.")
         self._annotated_file = path
 
@@ -106,7 +120,7 @@ class Annotation:
 
     @property
     def timestamp(self) -> str:
-        return time.strftime("%Y-%m-%d_%H-%M-%S", self.creation_time)
+        return __format_timestamp__(self._creation_time)
 
     @property
     def progress(self) -> int:
@@ -115,13 +129,7 @@ class Annotation:
         (Rounded up to the next integer)
         """
         n_frames = self.samples[-1].end_position + 1
-        n_annotations = sum(
-            [
-                s.end_position - s.start_position + 1
-                for s in self.samples
-                if not s.annotation.is_empty()
-            ]
-        )
+        n_annotations = sum(len(s) for s in self.samples if not s.annotation.is_empty())
         return int(n_annotations / n_frames * 100)
 
     @property
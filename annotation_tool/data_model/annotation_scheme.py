@@ -6,6 +6,11 @@ from typing import List
 
 from annotation_tool.utility.decorators import accepts, returns
 
+__scheme_element__ = namedtuple(
+    "scheme_element",
+    ["group_name", "element_name", "row", "column"],
+)
+
 
 @returns(bool)
 @accepts(List)
@@ -38,13 +43,9 @@ class AnnotationScheme:
         return self._n
 
     def __iter__(self):
-        scheme_element = namedtuple(
-            "scheme_element",
-            ["group_name", "element_name", "row", "column"],
-        )
         for row, (group_name, group_elements) in enumerate(self.scheme):
             for col, elem in enumerate(group_elements):
-                yield scheme_element(group_name, elem, row, col)
+                yield __scheme_element__(group_name, elem, row, col)
 
     def __copy__(self):
         return AnnotationScheme(self.scheme, self._scheme_str, self._n)
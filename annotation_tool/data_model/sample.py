@@ -1,20 +1,20 @@
 from copy import deepcopy
 from dataclasses import dataclass, field
+import functools
 import random
 from typing import Tuple
 
 from distinctipy import distinctipy
 
+from annotation_tool.data_model.annotation_scheme import AnnotationScheme
 from annotation_tool.data_model.single_annotation import SingleAnnotation
-from annotation_tool.utility.decorators import accepts, accepts_m, returns
+from annotation_tool.utility.decorators import accepts, dataclass_slots, returns
 
 random.seed(42)
 __color_map__ = distinctipy.get_colors(50, n_attempts=250)
 __default_color__ = 105, 105, 105
 
 
-@returns(tuple)
-@accepts(SingleAnnotation)
 def __annotation_to_color__(annotation: SingleAnnotation) -> Tuple[int, int, int]:
     """
     Converts an annotation to a color.
@@ -27,13 +27,22 @@ def __annotation_to_color__(annotation: SingleAnnotation) -> Tuple[int, int, int
     """
     if annotation is None:
         raise ValueError("Annotation must not be None.")
-    if annotation.is_empty():
+    return __color_of__(annotation.scheme, annotation.binary_str)
+
+
+@functools.lru_cache(maxsize=1024)
+def __color_of__(scheme: AnnotationScheme, binary_str: str) -> Tuple[int, int, int]:
+    """
+    Computes the color of an annotation given by its scheme and binary-string.
+    Both are immutable, so the result can be cached.
+    """
+    if "1" not in binary_str:
         return __default_color__
     x = 0
-    for idx, attribute in enumerate(annotation):
-        if attribute.row >= 1:
+    for idx, scheme_element in enumerate(scheme):
+        if scheme_element.row >= 1:
             break
-        x += attribute.value * (2**idx)
+        x += int(binary_str[idx]) * (2**idx)
 
     x %= len(__color_map__)
 
@@ -43,66 +52,58 @@ def __annotation_to_color__(annotation: SingleAnnotation) -> Tuple[int, int, int
     return r, g, b
 
 
+@dataclass_slots
 @dataclass(order=True, unsafe_hash=True)
 class Sample:
     _start_pos: int = field(init=True, hash=True, compare=True)
     _end_pos: int = field(init=True, hash=True, compare=True)
     _annotation: SingleAnnotation = field(init=True, hash=False, compare=False)
-    _color: Tuple[int, int, int] = field(init=False, hash=False, compare=False)
-
-    def __post_init__(self):
-        self._color = __annotation_to_color__(self._annotation)
 
     def __len__(self):
         return (self._end_pos - self._start_pos) + 1
 
     @property
-    @returns(int)
     def start_position(self):
         return self._start_pos
 
     @start_position.setter
-    @accepts_m(int)
     def start_position(self, value):
+        assert isinstance(value, int)
         if value < 0:
             raise ValueError
         else:
             self._start_pos = value
 
     @property
-    @returns(int)
     def end_position(self):
         return self._end_pos
 
     @end_position.setter
-    @accepts_m(int)
     def end_position(self, value):
+        assert isinstance(value, int)
         if value < 0:
             raise ValueError
         else:
             self._end_pos = value
 
     @property
-    @returns(SingleAnnotation)
     def annotation(self):
         return self._annotation
 
     @annotation.setter
-    @accepts_m(SingleAnnotation)
     def annotation(self, value):
         if value is None:
             raise ValueError("None not allowed")
+        assert isinstance(value, SingleAnnotation)
         # check compatibility
         if self.annotation.scheme != value.scheme:
             raise ValueError("Incompatible schemes")
         self._annotation = value
-        self._color = __annotation_to_color__(
-            value
-        )  # update color, computing it is expensive
 
     @property
     def color(self):
-        return self._color
+        # computed when the sample is drawn, cached per annotation-content
+        return __annotation_to_color__(self._annotation)
 
     def __copy__(self):
         return Sample(self._start_pos, self._end_pos, self._annotation)
@@ -8,6 +8,11 @@ from annotation_tool.utility.decorators import accepts, returns
 
 from .annotation_scheme import AnnotationScheme
 
+__annotation_attribute__ = namedtuple(
+    "annotation_attribute",
+    ["group_name", "element_name", "value", "row", "column"],
+)
+
 
 @returns(type(True))
 @accepts((np.ndarray, dict), AnnotationScheme)
@@ -163,18 +168,13 @@ class SingleAnnotation:
         return new_anno
 
     def __iter__(self):
-        annotation_element = namedtuple(
-            "annotation_attribute",
-            ["group_name", "element_name", "value", "row", "column"],
-        )
-
         for scheme_element in self.scheme:
             group_name = scheme_element.group_name
             element_name = scheme_element.element_name
             row, col = scheme_element.row, scheme_element.column
             value = self.annotation_dict[group_name][element_name]
 
-            yield annotation_element(group_name, element_name, value, row, col)
+            yield __annotation_attribute__(group_name, element_name, value, row, col)
 
     def __hash__(self):
         # logging.warning("Hash of annotation is deprecated")
@@ -6,7 +6,7 @@ import PyQt6.QtWidgets as qtw
 import numpy as np
 
 from annotation_tool.data_model import Annotation, Dataset
-from annotation_tool.media_reader import media_reader as mr
+from annotation_tool.media_reader import meta_data
 from annotation_tool.qt_helper_widgets.line_edit_adapted import QLineEditAdapted
 from annotation_tool.settings import settings
 
@@ -196,7 +196,8 @@ class ImportAnnotationDialog(qtw.QDialog):
 
             try:
                 input_path = Path(self.input_path)
-                media_reader = mr(input_path)
+                # cached, creating the annotation below reuses the same lookup
+                n_frames = meta_data(input_path).get("n_frames", 0)
             except ValueError:
                 msg = qtw.QMessageBox(self)
                 msg.setIcon(qtw.QMessageBox.Icon.Critical)
@@ -225,7 +226,7 @@ class ImportAnnotationDialog(qtw.QDialog):
                 self.check_enabled()
                 return
 
-            if annotation.shape[0] != len(media_reader):
+            if annotation.shape[0] != n_frames:
                 msg = qtw.QMessageBox(self)
                 msg.setIcon(qtw.QMessageBox.Icon.Critical)
                 msg.setText("Annotation and media file do not match.")
@@ -277,7 +278,7 @@ class ImportAnnotationDialog(qtw.QDialog):
                 annotator_id,
                 dataset,
                 self.annotation_name_edit.text(),
-                media_reader.path,
+                input_path,
             )
 
             annotation.samples = samples
@@ -5,7 +5,7 @@ import PyQt6.QtCore as qtc
 import PyQt6.QtWidgets as qtw
 
 from annotation_tool.data_model import Annotation, Dataset, create_annotation
-from annotation_tool.media_reader import media_reader as mr
+from annotation_tool.media_reader import meta_data
 from annotation_tool.qt_helper_widgets.line_edit_adapted import QLineEditAdapted
 from annotation_tool.settings import settings
 
@@ -140,15 +140,17 @@ class NewAnnotationDialog(qtw.QDialog):
     def open_pressed(self):
         self.check_enabled()
         if self.open_button.isEnabled():
+            input_path = Path(self.input_path)
             try:
-                media_reader = mr(Path(self.input_path))
-                if len(media_reader) < 1000:
+                # cached, creating the annotation below reuses the same lookup
+                n_frames = meta_data(input_path).get("n_frames", 0)
+                if n_frames < 1000:
                     msg = qtw.QMessageBox(self)
                     msg.setIcon(qtw.QMessageBox.Icon.Critical)
                     msg.setText("Media too short.")
                     msg.setInformativeText(
                         "The selected media's length [={}] is too small.\nIt should at least consist of 1000 frames!".format(
-                            len(media_reader)
+                            n_frames
                         )
                     )
                     msg.setWindowTitle("Error")
@@ -179,7 +181,7 @@ class NewAnnotationDialog(qtw.QDialog):
                 annotator_id,
                 dataset,
                 self.annotation_name_edit.text(),
-                media_reader.path,
+                input_path,
             )
             self.close()
             self.load_annotation.emit(annotation)
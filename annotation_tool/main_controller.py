@@ -70,12 +70,8 @@ class MainApplication(qtw.QApplication):
 
         # from QAnnotationWidget
         self.annotation_controller.samples_changed.connect(self.timeline.set_samples)
-        self.annotation_controller.right_widget_changed.connect(
-            lambda w: self.gui.set_widget(w, LayoutPosition.RIGHT)
-        )
-        self.annotation_controller.tool_widget_changed.connect(
-            lambda w: self.gui.set_widget(w, LayoutPosition.BOTTOM_LEFT)
-        )
+        self.annotation_controller.right_widget_changed.connect(self.set_right_widget)
+        self.annotation_controller.tool_widget_changed.connect(self.set_tool_widget)
         self.annotation_controller.start_loop.connect(self.mediator.start_loop)
         self.annotation_controller.stop_loop.connect(self.mediator.stop_loop)
         self.annotation_controller.pause_replay.connect(self.playback.pause)
@@ -159,6 +155,14 @@ class MainApplication(qtw.QApplication):
         else:
             raise RuntimeError("State must not be None")
 
+    @qtc.pyqtSlot(qtw.QWidget)
+    def set_right_widget(self, widget: qtw.QWidget):
+        self.gui.set_widget(widget, LayoutPosition.RIGHT)
+
+    @qtc.pyqtSlot(qtw.QWidget)
+    def set_tool_widget(self, widget: qtw.QWidget):
+        self.gui.set_widget(widget, LayoutPosition.BOTTOM_LEFT)
+
     @qtc.pyqtSlot(list)
     def set_additional_media_paths(self, paths: list):
         if self.current_annotation is not None:
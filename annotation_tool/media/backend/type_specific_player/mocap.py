@@ -1,5 +1,7 @@
 import logging
+from pathlib import Path
 
+import PyQt6.QtCore as qtc
 import PyQt6.QtWidgets as qtw
 import numpy as np
 import pyqtgraph.opengl as gl
@@ -9,10 +11,22 @@ from annotation_tool.media_reader import media_reader as mr
 
 
 class MocapPlayer(AbstractMediaPlayer):
+    load_worker = qtc.pyqtSignal(Path)
+    stop_worker = qtc.pyqtSignal()
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.setLayout(qtw.QHBoxLayout())
-        self.media = None
+        # only the precomputed skeletons are kept, not the reader or raw data
+        self.frames = None
+        # height of the lowest foot in each frame
+        self.floor_heights = None
+        # reused for every drawn frame, avoids an allocation per frame
+        self._skeleton_buffer = np.empty((44, 3), dtype=np.float32)
+        # index of the frame currently shown, None if nothing is drawn yet
+        self._drawn_frame = None
+        # True while a redraw is scheduled, further position updates are coalesced
+        self._redraw_pending = False
 
         self.graph = gl.GLViewWidget()
         # allow only mouse events
@@ -23,61 +37,140 @@ class MocapPlayer(AbstractMediaPlayer):
 
         self.graph.addItem(self.zgrid)
 
+        # colors and width never change, only the positions are updated per frame
         self.current_skeleton = gl.GLLinePlotItem(
-            pos=np.array([[0, 0, 0], [0, 0, 0]]),
-            color=np.array([[0, 0, 0, 0], [0, 0, 0, 0]]),
+            pos=np.zeros((44, 3), dtype=np.float32),
+            color=_skeleton_colors_arr,
+            width=4,
             mode="lines",
         )
         self.graph.addItem(self.current_skeleton)
         self.layout().addWidget(self.graph)
 
+        # parsing and precomputing the skeletons happens off the GUI-thread
+        self.worker_thread = qtc.QThread()
+        self.worker = MocapHelper()
+        self.init_worker()
+
+        self._active = True
+
     def get_skeleton(self, idx):
-        array = self.media[idx]
-        skeleton = _calculate_skeleton(array)
-        skeleton = _fix_skeleton_height(skeleton)
+        skeleton = self._skeleton_buffer
+        np.copyto(skeleton, self.frames[idx])
+        # move the skeleton up or down so that the lowest foot touches the floor
+        skeleton[:, 2] -= self.floor_heights[idx]
         return skeleton
 
     def load(self, path):
-        self.media = mr(path, normalize=True)
-        self.n_frames = len(self.media)
-        self.fps = self.media.fps
+        self.load_worker.emit(path)
+
+    @qtc.pyqtSlot(float, object, object)
+    def worker_loaded(self, fps, frames, floor_heights):
+        if not self._active:
+            return  # already shut down while loading
+        self.n_frames = len(frames)
+        self.fps = fps
+        self.frames = frames
+        self.floor_heights = floor_heights
+        self._drawn_frame = None
         self.update_media_position()
         self.loaded.emit(self)
 
+    @qtc.pyqtSlot()
+    def worker_failed(self):
+        if self._active:
+            self.failed.emit(self)
+
     def update_media_position(self):
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            qtc.QTimer.singleShot(0, self.redraw)
+
+    @qtc.pyqtSlot()
+    def redraw(self):
+        # uses the latest position, all updates since scheduling are drawn at once
+        self._redraw_pending = False
+        if self.frames is None:
+            return  # not loaded yet
         pos = self.position + self.offset
         pos_adjusted = max(0, min(pos, self.n_frames - 1))
-        if self.media is not None:
+        if pos_adjusted != self._drawn_frame:
+            self._drawn_frame = pos_adjusted
             skeleton = self.get_skeleton(pos_adjusted)
-            self.current_skeleton.setData(
-                pos=skeleton, color=np.array(_skeleton_colors), width=4, mode="lines"
-            )
+            self.current_skeleton.setData(pos=skeleton)
 
-    def shutdown(self):
-        self.setFixedSize(0, 0)
-        self.hide()
-        self.media = None
+    def init_worker(self):
+        self.worker.moveToThread(self.worker_thread)
+
+        # connecting to worker
+        self.load_worker.connect(self.worker.load)
+        self.worker.loaded.connect(self.worker_loaded)
+        self.worker.failed.connect(self.worker_failed)
+        self.stop_worker.connect(self.worker.stop)
+
+        # setup nice exit
+        self.worker.finished.connect(self.worker_thread.quit)
+        self.worker_thread.finished.connect(self.thread_finished)
+
+        self.worker_thread.start()
+
+    def thread_finished(self):
+        logging.debug("MocapPlayer: Thread finished.")
         self.terminated = True
+        self.worker = None
+        self.worker_thread = None
         self.finished.emit(self)
         logging.debug("MocapPlayer shutdown")
 
+    @qtc.pyqtSlot()
+    def shutdown(self):
+        self._active = False
+        self.setFixedSize(0, 0)
+        self.hide()
+        self.frames = None
+        self.floor_heights = None
+        self.stop_worker.emit()
+
+    def kill(self):
+        """
+        This is called when the tool is closed.
+        --> This will block the main thread until the worker thread is finished.
+        Use shutdown instead if you only want to remove the widget from the screen.
+        """
+        if self.worker_thread is not None:
+            try:
+                self.worker_thread.quit()
+                self.worker_thread.wait()
+            except RuntimeError:
+                logging.debug("MocapPlayer: Worker-Thread already terminated.")
+            self.worker_thread = None
+        self.worker = None
 
-def _fix_skeleton_height(skeleton: np.ndarray) -> np.ndarray:
-    """
-    Centralize the skeleton to stay in the center of the coordinate system.
 
-    Args:
-        skeleton (np.ndarray): Skeleton to centralize.
+class MocapHelper(qtc.QObject):
+    loaded = qtc.pyqtSignal(float, object, object)
+    failed = qtc.pyqtSignal()
+    finished = qtc.pyqtSignal()
 
-    Returns:
-        np.ndarray: Centralized skeleton.
-    """
-    segments = [
-        _body_segments_reversed[i] for i in ["L toe", "R toe", "L foot", "R foot"]
-    ]
-    height = min(skeleton[segment * 2, 2] for segment in segments)
-    skeleton[:, 2] -= height
-    return skeleton
+    @qtc.pyqtSlot(Path)
+    def load(self, path: Path):
+        try:
+            media = mr(path, normalize=True)
+            fps = media.fps
+            frames = _calculate_skeletons(media.numpy(0, len(media)))
+            # computed here as well, the GUI-thread only stores the results
+            floor_heights = frames[:, _foot_rows, 2].min(axis=1)
+        except Exception as e:
+            logging.error(f"MocapHelper: Loading {path} failed: {e}")
+            self.failed.emit()
+            return
+        # only the skeletons are handed over, the reader and its raw data are dropped
+        self.loaded.emit(fps, frames, floor_heights)
+
+    @qtc.pyqtSlot()
+    def stop(self):
+        self.finished.emit()
+        logging.info("MocapHelper: finished")
 
 
 _body_segments = {
@@ -108,6 +201,41 @@ _body_segments = {
 
 _body_segments_reversed = {v: k for k, v in _body_segments.items()}
 
+# rows of the skeleton holding the start points of the feet and toes
+_foot_rows = np.array(
+    [_body_segments_reversed[i] * 2 for i in ["L toe", "R toe", "L foot", "R foot"]],
+    dtype=np.intp,
+)
+
+# each bodysegment is drawn as a line from itself (source) to this bodysegment (target)
+_segment_targets = np.array(
+    [
+        2,  # 0   head      -> l collar/rcollar
+        0,  # 1   head end  -> head
+        11,  # 2 l collar    -> lowerback
+        6,  # 3 l elbow     -> l humerus
+        21,  # 4 l femur     -> root
+        7,  # 5 l foot      -> l tibia
+        2,  # 6 l humerus   -> l collar
+        4,  # 7 l tibia     -> l femur
+        5,  # 8 l toe       -> l foot
+        3,  # 9 l wrist     -> l elbow
+        9,  # 10 l wrist end -> l wrist
+        11,  # 11   lowerback -> lowerback
+        11,  # 12 r collar    -> lowerback
+        16,  # 13 r elbow     -> r humerus
+        21,  # 14 r femur     -> root
+        17,  # 15 r foot      -> r tibia
+        12,  # 16 r humerus   -> r collar
+        14,  # 17 r tibia     -> r femur
+        15,  # 18 r toe       -> r foot
+        13,  # 19 r wrist     -> r elbow
+        19,  # 20 r wrist end -> r wrist
+        11,  # 21   root      -> lowerback
+    ],
+    dtype=np.intp,
+)
+
 _colors = {"r": (1, 0, 0, 1), "g": (0, 1, 0, 1), "b": (0, 0, 1, 1), "y": (1, 1, 0, 1)}
 
 # each bodysegmentline needs 2 _colors because each has a start and end.
@@ -158,6 +286,8 @@ _skeleton_colors = (
     _colors["b"],
     _colors["b"],  # root
 )
+# converted once, handed to the GL item when the player is created
+_skeleton_colors_arr = np.asarray(_skeleton_colors, dtype=np.float32)
 
 
 def _calculate_skeleton(frame: np.array) -> np.array:
@@ -181,54 +311,35 @@ def _calculate_skeleton(frame: np.array) -> np.array:
 
     """
 
-    # Extraction of Translational data for each bodysegment (source)
-    tx = []
-    ty = []
-    tz = []
-    for i in range(22):
-        tx.append(frame[i * 6 + 3])
-        ty.append(frame[i * 6 + 4])
-        tz.append(frame[i * 6 + 5])
-
-    # Extraction of Translational data for each bodysegment (target)
-    tu = []  # corresponds to x coordinates
-    tv = []  # corresponds to y coordinates
-    tw = []  # corresponds to z coordinates
-    offset = 3
-    for coords in [tu, tv, tw]:  # xyz        ->     uvw
-        coords.append(frame[2 * 6 + offset])  # 0   head      -> l collar/rcollar
-        coords.append(frame[0 * 6 + offset])  # 1   head end  -> head
-        coords.append(frame[11 * 6 + offset])  # 2 l collar    -> lowerback
-        coords.append(frame[6 * 6 + offset])  # 3 l elbow     -> l humerus
-        coords.append(frame[21 * 6 + offset])  # 4 l femur     -> root
-        coords.append(frame[7 * 6 + offset])  # 5 l foot      -> l tibia
-        coords.append(frame[2 * 6 + offset])  # 6 l humerus   -> l collar
-        coords.append(frame[4 * 6 + offset])  # 7 l tibia     -> l femur
-        coords.append(frame[5 * 6 + offset])  # 8 l toe       -> l foot
-        coords.append(frame[3 * 6 + offset])  # 9 l wrist     -> l elbow
-        coords.append(frame[9 * 6 + offset])  # 10 l wrist end -> l wrist
-        coords.append(frame[11 * 6 + offset])  # 11   lowerback -> lowerback
-        coords.append(frame[11 * 6 + offset])  # 12 r collar    -> lowerback
-        coords.append(frame[16 * 6 + offset])  # 13 r elbow     -> r humerus
-        coords.append(frame[21 * 6 + offset])  # 14 r femur     -> root
-        coords.append(frame[17 * 6 + offset])  # 15 r foot      -> r tibia
-        coords.append(frame[12 * 6 + offset])  # 16 r humerus   -> r collar
-        coords.append(frame[14 * 6 + offset])  # 17 r tibia     -> r femur
-        coords.append(frame[15 * 6 + offset])  # 18 r toe       -> r foot
-        coords.append(frame[13 * 6 + offset])  # 19 r wrist     -> r elbow
-        coords.append(frame[19 * 6 + offset])  # 20 r wrist end -> r wrist
-        coords.append(frame[11 * 6 + offset])  # 21   root      -> lowerback
-        offset += 1
-
-    # combine the 3 lists of source coordinates into a 3-tupel list
-    txyz = list(zip(tx, ty, tz))
-    # combine the 3 lists of target coordinates into a 3-tupel list
-    tuvw = list(zip(tu, tv, tw))
-    # append the coordinates from source and target alternatingly to a single list
-    t_all = []
-    for a, b in zip(txyz, tuvw):
-        t_all.append(a)
-        t_all.append(b)
-
-    # convert the list into an array, convert mm to meters and return the result
-    return np.array(t_all) / 1000
+    return _calculate_skeletons(frame[np.newaxis])[0]
+
+
+def _calculate_skeletons(array: np.array) -> np.array:
+    """Calculates the lines indicating positions of bodysegments for all timesteps
+
+    Arguments:
+    ---------
+    array : numpy.array
+        2D array with shape (t,132) with t as number of timesteps in the data
+    ---------
+
+    Returns:
+    ---------
+    array : numpy.array
+        3D array with shape (t,44,3).
+        Contains the skeleton of each timestep, see _calculate_skeleton.
+    ---------
+    """
+    # reshaping to (t, 22, 6) is a view for C-order, as returned by the LARa reader
+    array = np.ascontiguousarray(array, dtype=np.float32)
+    # float32 is precise enough for drawing and halves memory and upload size
+    skeletons = np.empty((array.shape[0], 44, 3), dtype=np.float32)
+    segments = array.reshape(array.shape[0], 22, 6)
+    # start point of each bodysegment (source)
+    skeletons[:, 0::2] = segments[:, :, 3:6]
+    # end point of each bodysegment (target)
+    skeletons[:, 1::2] = segments[:, _segment_targets, 3:6]
+
+    # convert mm to meters
+    skeletons /= np.float32(1000)
+    return skeletons
@@ -312,9 +312,8 @@ def meta_data(file: Path) -> dict:
         dict: The metadata. If the file does not exist, an empty dictionary is returned.
     """
     try:
-        last_change = int(os.path.getmtime(file))
-        size = os.path.getsize(file)
-        identifier = (last_change, size)
+        stat = os.stat(file)
+        identifier = (int(stat.st_mtime), stat.st_size)
         return _meta_data(file, identifier)
     except FileNotFoundError:
         return {}
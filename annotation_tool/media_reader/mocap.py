@@ -24,6 +24,9 @@ class MocapReader(MediaReader):
     def __get_frame__(self, idx: int) -> np.ndarray:
         return self._mocap_reader.get_frame(idx)
 
+    def numpy(self, lo: int, hi: int, step: int = 1) -> np.ndarray:
+        return self._mocap_reader.get_frames(lo, hi)[::step]
+
     def __get_frame_count__(self) -> int:
         return self._mocap_reader.get_frame_count()
 
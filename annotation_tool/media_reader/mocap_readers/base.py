@@ -37,6 +37,20 @@ class MocapReaderBase(abc.ABC):
         """
         pass
 
+    def get_frames(self, lo: int, hi: int) -> np.ndarray:
+        """
+        Returns the frames between lo and hi as a single array.
+        Readers holding all frames in memory should override this.
+
+        Args:
+            lo (int): The index of the first frame.
+            hi (int): The index after the last frame.
+
+        Returns:
+            np.ndarray: The frames stacked along the first axis.
+        """
+        return np.array([self.get_frame(i) for i in range(lo, hi)])
+
     @abc.abstractmethod
     def get_frame_count(self) -> int:
         """
@@ -1,5 +1,6 @@
 import logging
 from pathlib import Path
+from typing import Tuple
 
 import numpy as np
 
@@ -21,7 +22,7 @@ def load_lara_mocap(path: Path, normalize: bool) -> np.ndarray:
         np.ndarray: The mocap data.
 
     Raises:
-        AssertionError: If the data type is not supported.
+        ValueError: If the file is not a valid LARa-mocap file.
     """
     _hash = checksum(path)
     _key = (_hash, normalize)
@@ -39,55 +40,92 @@ def load_lara_mocap(path: Path, normalize: bool) -> np.ndarray:
             return mocap
 
 
-def __load_lara_mocap__(path: Path, normalize: bool) -> np.ndarray:
-    def is_data_row(line2check: str) -> bool:
-        """
-        Checks if a line is a data row.
-        Specific checking for the LARa dataset.
-
-        Args:
-            line2check (str): Line to check.
+def __count_data_columns__(line: str) -> int:
+    """
+    Counts the columns of a data row.
+    Specific checking for the LARa dataset.
 
-        Returns:
-            bool: True if the line is a data row.
-        """
-        try:
-            tst_array = np.fromstring(line2check, dtype=np.float64, sep=",")
-            return tst_array.shape[0] in [132, 133, 134]
-        except ValueError:
-            return False
+    Args:
+        line (str): Line to check.
 
+    Returns:
+        int: The number of columns, 0 if the line is not a data row.
+    """
+    # cheap check first, only parse lines with a plausible number of columns
+    if line.count(",") + 1 not in [132, 133, 134]:
+        return 0
     try:
-        # Check number of header lines:
-        with open(path, "r") as f:
-            header_lines = 0
-            for line in f:
-                if is_data_row(line):
-                    break
-                else:
-                    header_lines += 1
-                if header_lines > 5:
-                    raise TypeError("Too many header lines in mocap file.")
+        tst_array = np.fromstring(line, dtype=np.float64, sep=",")
+    except ValueError:
+        return 0
+    n_columns = tst_array.shape[0]
+    return n_columns if n_columns in [132, 133, 134] else 0
 
-        if header_lines in [1, 5]:
-            array = np.loadtxt(
-                path, delimiter=",", skiprows=header_lines, dtype=np.float64
-            )
 
-            if array.shape[1] == 134:
-                array = array[:, 2:]
+def __probe_lara_csv__(path: Path) -> Tuple[int, int]:
+    """
+    Counts the header lines and data columns of a LARa-mocap file.
+    Only the first few lines of the file are read.
+
+    Args:
+        path (Path): The path to the LARa-mocap file.
+
+    Returns:
+        Tuple[int, int]: (#Header_Lines, #Columns).
+
+    Raises:
+        ValueError: If there are too many header lines.
+    """
+    with open(path, "r") as f:
+        for header_lines in range(6):
+            n_columns = __count_data_columns__(f.readline())
+            if n_columns > 0:
+                return header_lines, n_columns
+    raise ValueError("Too many header lines in mocap file.")
+
+
+def __load_lara_mocap__(path: Path, normalize: bool) -> np.ndarray:
+    try:
+        header_lines, n_columns = __probe_lara_csv__(path)
 
-            if array.shape[1] == 133:
-                array = array[:, 1:]
+        if header_lines in [1, 5]:
+            array = __read_lara_csv__(path, header_lines, n_columns)
 
             if normalize:
                 array = __normalize_lara_mocap__(array)
 
             return array
         else:
-            raise TypeError("The number of header lines is not supported.")
-    except Exception:
-        raise TypeError("Loading mocap failed.")
+            raise ValueError("The number of header lines is not supported.")
+    except Exception as e:
+        raise ValueError("Loading mocap failed.") from e
+
+
+def __read_lara_csv__(path: Path, header_lines: int, n_columns: int) -> np.ndarray:
+    """
+    Reads the raw data rows of a LARa-mocap file.
+    Leading columns (e.g. sample-index and class-label) are skipped while parsing,
+    only the last 132 columns are read.
+    The values are parsed directly into float32, which is precise enough
+    for the mocap data and halves the memory.
+
+    Args:
+        path (Path): The path to the LARa-mocap file.
+        header_lines (int): The number of header lines to skip.
+        n_columns (int): The number of columns in the file.
+
+    Returns:
+        np.ndarray: The raw mocap data with shape (t, 132) and dtype float32.
+    """
+    use_cols = range(n_columns - 132, n_columns)
+    return np.loadtxt(
+        path,
+        delimiter=",",
+        skiprows=header_lines,
+        usecols=use_cols,
+        dtype=np.float32,
+        ndmin=2,
+    )
 
 
 def __normalize_lara_mocap__(array: np.array) -> np.array:
@@ -95,6 +133,7 @@ def __normalize_lara_mocap__(array: np.array) -> np.array:
 
     The data gets normalized by subtraction of the lower backs data from every body-segment.
     That way the lower back is in the origin.
+    C-contiguous float32 arrays are normalized in-place.
 
     Arguments:
     ---------
@@ -115,10 +154,13 @@ def __normalize_lara_mocap__(array: np.array) -> np.array:
     ---------
     """
 
-    normalizing_vector = array[:, 66:72]  # 66:72 are the columns for lower back
-    for _ in range(21):
-        normalizing_vector = np.hstack((normalizing_vector, array[:, 66:72]))
-    array = np.subtract(array, normalizing_vector)
+    array = np.ascontiguousarray(array, dtype=np.float32)
+
+    lower_back = array[:, 66:72].copy()  # 66:72 are the columns for lower back
+
+    # view as (t, 22, 6) and broadcast the lower back over all body-segments
+    segments = array.reshape(array.shape[0], 22, 6)
+    segments -= lower_back[:, np.newaxis, :]
     return array
 
 
@@ -157,6 +199,9 @@ class LARaMocapReader(MocapReaderBase):
 
         return self.mocap[frame_idx]
 
+    def get_frames(self, lo: int, hi: int) -> np.ndarray:
+        return self.mocap[lo:hi]
+
     def get_frame_count(self) -> int:
         return self.mocap.shape[0]
 
@@ -168,10 +213,12 @@ class LARaMocapReader(MocapReaderBase):
 
     @staticmethod
     def is_supported(path: Path) -> bool:
-        # TODO: improve this
+        path = Path(path)
+        if path.suffix.lower() != ".csv":
+            return False
         try:
-            load_lara_mocap(Path(path), True)
-            return True
+            header_lines, _ = __probe_lara_csv__(path)
+            return header_lines in [1, 5]
         except:  # noqa E722
             return False
 
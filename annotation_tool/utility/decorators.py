@@ -1,3 +1,4 @@
+import dataclasses
 import typing
 
 
@@ -59,3 +60,42 @@ def returns(rtype: typing.Type) -> typing.Callable:
         return new_f
 
     return check_returns
+
+
+def dataclass_slots(cls: typing.Type) -> typing.Type:
+    """Add __slots__ to a dataclass (backport of dataclass(slots=True)).
+
+    The dataclass is recreated with a slot for each of its fields, so instances
+    no longer carry a __dict__. Instances pickled before the class was slotted
+    store their state as a dict, __setstate__ accepts both formats and skips
+    values of fields that no longer exist.
+
+    Args:
+        cls (Type): Class already processed by the dataclass-decorator.
+
+    Returns:
+        Type: Slotted version of the class.
+    """
+    field_names = tuple(f.name for f in dataclasses.fields(cls))
+
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    def __setstate__(self, state):
+        if isinstance(state, tuple):
+            # (dict-state, slots-state)
+            _dict_state, _slots_state = state
+            state = {**(_dict_state or {}), **(_slots_state or {})}
+        for key, value in state.items():
+            if key in field_names:
+                object.__setattr__(self, key, value)
+
+    cls_dict.setdefault("__setstate__", __setstate__)
+
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
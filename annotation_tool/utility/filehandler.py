@@ -1,12 +1,14 @@
 import csv
+import functools
 import hashlib
 import json
 import logging
 import logging.config
 import os
 from pathlib import Path
+import stat
 import string
-from typing import List, Tuple, Union
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -20,7 +22,26 @@ def is_non_zero_file(path: Path) -> bool:
     Returns:
         bool: True if file is non-zero.
     """
-    return path.is_file() and os.path.getsize(path) > 0
+    return non_zero_file_stat(path) is not None
+
+
+def non_zero_file_stat(path: Path) -> Optional[os.stat_result]:
+    """Stat the file once and check if it exists and is non-empty.
+    The result can be passed on to avoid further stat-calls.
+
+    Args:
+        path (Path): file-path.
+
+    Returns:
+        Optional[os.stat_result]: The stat of the file if it is non-zero, else None.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if stat.S_ISREG(st.st_mode) and st.st_size > 0:
+        return st
+    return None
 
 
 def __approx_md5__(path: Path, n_blocks=20, block_size=2**12) -> str:
@@ -59,27 +80,40 @@ def __approx_md5__(path: Path, n_blocks=20, block_size=2**12) -> str:
     return m.hexdigest()
 
 
-def checksum(path: Path) -> str:
+def checksum(path: Path, st: Optional[os.stat_result] = None) -> str:
     """Return unique ID for the given path. The ID is computed by
     hashing some parts of the file and appending the file-size.
     The runtime of this function is independent of the file-size and only depends on the number of blocks and the block-size.
 
+    The result is cached as long as modification-time and size of the file do not change.
+
     Note: This is not a cryptographic hash-function and should not be used as such.
 
     Args:
         path (Path): Location of the file.
+        st (os.stat_result, optional): Result of non_zero_file_stat(path),
+        saves another stat-call if the caller already has it.
     Returns:
         str: Hash-value computed for the specified file.
     """
-    if is_non_zero_file(path):
-        _md5 = __approx_md5__(path)
-        _size = os.path.getsize(path)
-        res = f"{_md5}_{_size}B"
-        return res
+    if st is None:
+        st = non_zero_file_stat(path)
+    if st is not None:
+        return __checksum__(path, (st.st_mtime_ns, st.st_size))
     else:
         raise FileNotFoundError(f"File {path} does not exist or is empty.")
 
 
+@functools.lru_cache(maxsize=1024)
+def __checksum__(path: Path, identifier: Tuple[int, int]) -> str:
+    """
+    The identifier-arg is only used for caching.
+    """
+    _md5 = __approx_md5__(path)
+    _size = identifier[1]
+    return f"{_md5}_{_size}B"
+
+
 def read_json(path: Path) -> dict:
     """Try reading .json-file from the specified path.
 